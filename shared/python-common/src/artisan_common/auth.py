@@ -8,24 +8,83 @@ Used as a FastAPI dependency in protected routes:
     @router.get("/artworks")
     async def list_artworks(user: User = Depends(get_current_user)):
         print(f"Request from {user.sub} with roles {user.roles}")
+
+Open and close the shared HTTP client (used for JWKS fetches) with the app:
+
+    from contextlib import asynccontextmanager
+    from artisan_common import auth
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        await auth.startup()
+        yield
+        await auth.shutdown()
+
+    app = FastAPI(lifespan=lifespan)
 """
 
-from dataclasses import dataclass, field
-from typing import Any
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import time
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
 
-import httpx
 import structlog
+from cachetools import TLRUCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+
+from artisan_common.config import get_settings
+
+if TYPE_CHECKING:
+    # httpx and python-jose are imported lazily (on first JWKS fetch or
+    # first token verification) to keep them off the service import path
+    import httpx
+    from jose.backends.base import Key
 
 logger = structlog.get_logger()
 
 # FastAPI security scheme — extracts Bearer token from Authorization header
 _bearer_scheme = HTTPBearer()
 
-# Cache for Keycloak's JWKS (JSON Web Key Set)
-_jwks_cache: dict[str, Any] = {}
+# Shared HTTP client — reuses warm connections across JWKS fetches.
+# Created by startup() (or lazily on first fetch), closed by shutdown().
+_http_client: httpx.AsyncClient | None = None
+
+# How long fetched keys are trusted before refetching (picks up key rotation)
+_JWKS_TTL = 3600  # seconds
+
+# Minimum time between refetches triggered by a token with an unknown "kid"
+_JWKS_REFRESH_INTERVAL = 30  # seconds
+
+
+@dataclass(frozen=True)
+class _CachedJWKS:
+    """Keycloak's JWKS (JSON Web Key Set) parsed into signing keys by key ID."""
+
+    keys_by_kid: dict[str, Key]
+    fetched_at: float
+    expires_at: float
+
+    def is_fresh(self, refresh: bool) -> bool:
+        """Whether these keys can be used instead of fetching again."""
+        now = time.monotonic()
+        if refresh:
+            return now - self.fetched_at < _JWKS_REFRESH_INTERVAL
+        return now < self.expires_at
+
+
+# Cache for Keycloak's JWKS, keyed by (keycloak_url, realm)
+_jwks_cache: dict[tuple[str, str], _CachedJWKS] = {}
+
+# Serializes fetches so concurrent cold-start requests hit Keycloak once
+_jwks_lock = asyncio.Lock()
+
+# Upper bound on how long a verified token is served from cache
+_TOKEN_CACHE_TTL = 300  # seconds
 
 
 @dataclass(frozen=True)
@@ -38,20 +97,109 @@ class User:
     roles: list[str] = field(default_factory=list)
 
 
-async def _get_jwks(keycloak_url: str, realm: str) -> dict[str, Any]:
-    """Fetch Keycloak's public keys for JWT verification.
+@dataclass(frozen=True)
+class _VerifiedToken:
+    """A user whose token already passed signature verification.
 
-    Keys are cached after first fetch. In production, you'd add
-    TTL-based cache invalidation for key rotation.
+    roles is kept as a tuple and each hit gets a fresh User with its own
+    list, so a route that mutates user.roles cannot leak into other requests.
     """
-    if not _jwks_cache:
+
+    user: User
+    roles: tuple[str, ...]
+    exp: float  # The token's own "exp" claim (Unix time)
+
+
+def _token_ttu(_key: bytes, value: _VerifiedToken, now: float) -> float:
+    """Expire a cached token at its exp claim, capped at _TOKEN_CACHE_TTL."""
+    return now + min(value.exp - time.time(), _TOKEN_CACHE_TTL)
+
+
+# Verified tokens, keyed by token digest so repeat requests from the
+# same session skip RS256 verification entirely
+_token_cache: TLRUCache[bytes, _VerifiedToken] = TLRUCache(maxsize=10_000, ttu=_token_ttu)
+
+
+async def _get_jwks(keycloak_url: str, realm: str, refresh: bool = False) -> dict[str, Key]:
+    """Fetch Keycloak's public keys for JWT verification, indexed by "kid".
+
+    Keys are parsed into jose Key objects once per fetch rather than on
+    every jwt.decode call, and cached per realm for _JWKS_TTL seconds.
+    The fast path is a lock-free dict lookup; on a miss, the lock ensures
+    only one request fetches while the others wait for its result.
+
+    Pass refresh=True to refetch early (e.g., after key rotation). Early
+    refetches happen at most once per _JWKS_REFRESH_INTERVAL, so tokens
+    with made-up key IDs cannot flood Keycloak.
+    """
+    cache_key = (keycloak_url, realm)
+    cached = _jwks_cache.get(cache_key)
+    if cached and cached.is_fresh(refresh):
+        return cached.keys_by_kid
+
+    async with _jwks_lock:
+        # Another request may have refreshed the keys while we waited
+        cached = _jwks_cache.get(cache_key)
+        if cached and cached.is_fresh(refresh):
+            return cached.keys_by_kid
+
         jwks_url = f"{keycloak_url}/realms/{realm}/protocol/openid-connect/certs"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(jwks_url)
-            response.raise_for_status()
-            _jwks_cache.update(response.json())
-            logger.info("jwks_fetched", url=jwks_url)
-    return _jwks_cache
+        response = await _get_http_client().get(jwks_url)
+        response.raise_for_status()
+        keys_by_kid = _parse_signing_keys(response.json())
+        now = time.monotonic()
+        _jwks_cache[cache_key] = _CachedJWKS(keys_by_kid=keys_by_kid, fetched_at=now, expires_at=now + _JWKS_TTL)
+        logger.info("jwks_fetched", url=jwks_url, keys=len(keys_by_kid))
+        return keys_by_kid
+
+
+def _parse_signing_keys(jwks: dict[str, Any]) -> dict[str, Key]:
+    """Build jose Key objects for the RS256 signing keys in a JWKS.
+
+    Other keys (encryption keys, EC/OKP keys, other algorithms) are skipped,
+    since tokens are only ever verified with RS256.
+    """
+    from jose import jwk
+    from jose.exceptions import JWKError
+
+    keys_by_kid: dict[str, Key] = {}
+    for k in jwks.get("keys", []):
+        if "kid" not in k or k.get("use", "sig") != "sig":
+            continue
+        if k.get("kty") != "RSA" or k.get("alg", "RS256") != "RS256":
+            continue
+        try:
+            keys_by_kid[k["kid"]] = jwk.construct(k, algorithm="RS256")
+        except JWKError as e:
+            logger.warning("jwks_key_skipped", kid=k["kid"], error=str(e))
+    return keys_by_kid
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10),
+            timeout=5.0,
+        )
+    return _http_client
+
+
+async def startup() -> None:
+    """Create the shared HTTP client. Call once from the FastAPI lifespan."""
+    _get_http_client()
+
+
+async def shutdown() -> None:
+    """Close the shared HTTP client. Call once from the FastAPI lifespan."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 
 def _extract_roles(claims: dict[str, Any]) -> list[str]:
@@ -72,32 +220,63 @@ def _extract_roles(claims: dict[str, Any]) -> list[str]:
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(_bearer_scheme),
-    keycloak_url: str = "http://localhost:8080",
-    realm: str = "artisan",
-    audience: str = "artisan-api",
 ) -> User:
     """FastAPI dependency that validates JWT and returns the authenticated user.
 
+    Keycloak and audience settings come from get_settings()
+    (KEYCLOAK_URL, KEYCLOAK_REALM, JWT_AUDIENCE). Verified tokens are
+    cached until their own expiry (at most _TOKEN_CACHE_TTL seconds), so
+    only the first request of a session pays for signature verification.
+
     Raises HTTPException 401 if the token is missing, expired, or invalid.
     """
     token = credentials.credentials
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        return replace(cached.user, roles=list(cached.roles))
+
+    from jose import JWTError, jwt
+
+    settings = get_settings()
+    keycloak_url, realm = settings.keycloak_url, settings.keycloak_realm
 
     try:
-        jwks = await _get_jwks(keycloak_url, realm)
-        payload = jwt.decode(
+        kid = jwt.get_unverified_header(token).get("kid")
+        if not isinstance(kid, str):
+            # The header is attacker-controlled — a list or object would be unhashable
+            msg = f"Token header has no usable kid: {kid!r}"
+            raise JWTError(msg)
+        key = (await _get_jwks(keycloak_url, realm)).get(kid)
+        if key is None:
+            # Unknown kid — Keycloak may have rotated its keys since our last fetch
+            key = (await _get_jwks(keycloak_url, realm, refresh=True)).get(kid)
+        if key is None:
+            msg = f"No signing key matches kid {kid!r}"
+            raise JWTError(msg)
+
+        verify = functools.partial(
+            jwt.decode,
             token,
-            jwks,
+            key,
             algorithms=["RS256"],
-            audience=audience,
+            audience=settings.jwt_audience,
             options={"verify_exp": True},
         )
+        # RSA verification is CPU-bound — run it off the event loop so other
+        # requests keep being served meanwhile (only cache misses get here)
+        payload = await asyncio.to_thread(verify)
 
-        return User(
+        user = User(
             sub=payload.get("sub", ""),
             email=payload.get("email", ""),
             name=payload.get("preferred_username", ""),
             roles=_extract_roles(payload),
         )
+        exp = float(payload.get("exp", time.time() + _TOKEN_CACHE_TTL))
+        _token_cache[cache_key] = _VerifiedToken(user=user, roles=tuple(user.roles), exp=exp)
+        return user
 
     except JWTError as e:
         logger.warning("jwt_validation_failed", error=str(e))
@@ -1,4 +1,4 @@
-"""Centralized configuration management using Pydantic Settings.
+"""Centralized configuration management using msgspec Structs.
 
 Every service inherits from BaseServiceSettings and extends it
 with service-specific fields. Configuration is loaded from:
@@ -6,28 +6,54 @@ with service-specific fields. Configuration is loaded from:
   2. .env file (local development)
   3. Field defaults (sensible fallbacks)
 
+Settings are frozen msgspec Structs. Building one from the environment is
+a single msgspec.convert call, which keeps cold starts (K8s jobs, short-lived
+workers) cheap compared to Pydantic Settings' validator graph.
+
 Usage in a service:
     from artisan_common.config import BaseServiceSettings
 
-    class GallerySettings(BaseServiceSettings):
+    class GallerySettings(BaseServiceSettings, frozen=True):
         s3_bucket: str = "artisan-gallery"
         max_upload_size_mb: int = 10
 
-    settings = GallerySettings()
+    settings = GallerySettings.from_env()
+
+Inside request handlers, resolve settings through a cached factory so the
+environment is parsed once per process rather than once per request:
+    from functools import lru_cache
+
+    @lru_cache(maxsize=1)
+    def get_gallery_settings() -> GallerySettings:
+        return GallerySettings.from_env()
+
+    @router.get("/config")
+    async def show_config(settings: GallerySettings = Depends(get_gallery_settings)): ...
+
+Services without extra fields can use get_settings() below directly.
+
+Services that rely on Pydantic Settings features (validators, SecretStr, ...)
+can subclass artisan_common.pydantic_config.PydanticServiceSettings instead,
+which has the same fields. It lives in its own module so that importing this
+one does not load pydantic-settings.
 """
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+from functools import lru_cache
+from typing import Any, Self
 
+import msgspec
+from dotenv import dotenv_values
 
-class BaseServiceSettings(BaseSettings):
-    """Base configuration shared by all Artisan services."""
+# Boolean spellings accepted from the environment (the same set Pydantic accepts)
+_BOOL_STRINGS = {
+    **dict.fromkeys(("1", "on", "t", "true", "y", "yes"), True),
+    **dict.fromkeys(("0", "off", "f", "false", "n", "no"), False),
+}
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+
+class BaseServiceSettings(msgspec.Struct, frozen=True, kw_only=True):
+    """Base configuration shared by all Artisan services."""
 
     # ── Service Identity ──────────────────────────────────────
     service_name: str = "artisan-service"
@@ -57,3 +83,37 @@ class BaseServiceSettings(BaseSettings):
     # ── Observability (OpenTelemetry) ─────────────────────────
     otel_exporter_endpoint: str = "http://localhost:4317"
     otel_enabled: bool = True
+
+    @classmethod
+    def from_env(cls, env_file: str | None = ".env") -> Self:
+        """Load settings from environment variables, then the .env file, then defaults.
+
+        Variable names are matched case-insensitively and unknown
+        variables are ignored. String values are coerced to the field
+        types the way Pydantic Settings does: surrounding whitespace is
+        ignored for non-str fields (PORT=" 8001"), and booleans accept
+        1/0, true/false, t/f, yes/no, y/n and on/off in any case.
+        """
+        values: dict[str, str] = {}
+        if env_file and os.path.isfile(env_file):
+            values.update({key.lower(): value for key, value in dotenv_values(env_file).items() if value is not None})
+        values.update({key.lower(): value for key, value in os.environ.items()})
+
+        converted: dict[str, Any] = {}
+        for field in msgspec.structs.fields(cls):
+            if field.name not in values:
+                continue
+            value = values[field.name]
+            if field.type is not str:
+                value = value.strip()
+            converted[field.name] = _BOOL_STRINGS.get(value.lower(), value) if field.type is bool else value
+        return msgspec.convert(converted, cls, strict=False)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> BaseServiceSettings:
+    """Return the process-wide BaseServiceSettings, parsed on first call.
+
+    Safe to use as a FastAPI dependency: Depends(get_settings).
+    """
+    return BaseServiceSettings.from_env()
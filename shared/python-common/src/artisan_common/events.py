@@ -12,6 +12,11 @@ Usage — Publishing:
     await nats_client.connect()
     await nats_client.publish("art.created", {"artwork_id": "abc-123", "title": "Sunset"})
 
+Usage — High-rate publishing (ACKs awaited in batches):
+    for artwork in artworks:
+        await nats_client.publish_async("art.created", artwork)
+    await nats_client.flush()
+
 Usage — Subscribing:
     async def handle_art_created(event: dict) -> None:
         print(f"New artwork: {event['artwork_id']}")
@@ -19,15 +24,21 @@ Usage — Subscribing:
     await nats_client.subscribe("art.created", handler=handle_art_created)
 """
 
-import json
+import asyncio
+import base64
+import os
+from collections import deque
 from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
 
+import msgspec
 import nats
+import nats.errors
 import structlog
 from nats.aio.client import Client as NATSConnection
+from nats.aio.msg import Msg
+from nats.js.api import PubAck
 from nats.js.client import JetStreamContext
 
 logger = structlog.get_logger()
@@ -35,19 +46,71 @@ logger = structlog.get_logger()
 # Type alias for event handler functions
 EventHandler = Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
 
+# Backoff between retries when a subscription's fetch fails (doubles per failure)
+_FETCH_RETRY_DELAY_MIN = 0.5  # seconds
+_FETCH_RETRY_DELAY_MAX = 30.0  # seconds
+
+
+class Envelope(msgspec.Struct):
+    """Standard wrapper around every published event payload.
+
+    Encoded as JSON, e.g.:
+        {
+            "event_id": "22-char url-safe base64 (128 random bits)",
+            "subject": "art.created",
+            "timestamp": "ISO-8601, UTC with a Z suffix",
+            "data": { ... your payload ... }
+        }
+    """
+
+    event_id: str
+    subject: str
+    timestamp: datetime
+    data: dict[str, Any] = {}
+
 
 class NATSClient:
-    """NATS JetStream client for event-driven communication."""
+    """NATS JetStream client for event-driven communication.
 
-    def __init__(self, nats_url: str = "nats://localhost:4222", stream_name: str = "ARTISAN") -> None:
+    Args:
+        nats_url: NATS server URL.
+        stream_name: JetStream stream that holds all Artisan subjects.
+        max_pending: Maximum publish_async() calls in flight before waiting for ACKs.
+        pending_size: Outbound buffer size in bytes. The buffer is flushed once
+                      it grows past this size, and it also caps how much can be
+                      published while reconnecting. nats-py defaults to 2 MiB;
+                      64 KiB suits the small JSON events used here.
+        flusher_queue_size: Maximum queued flush requests for the outbound buffer.
+    """
+
+    def __init__(
+        self,
+        nats_url: str = "nats://localhost:4222",
+        stream_name: str = "ARTISAN",
+        max_pending: int = 1024,
+        pending_size: int = 65536,
+        flusher_queue_size: int = 1024,
+    ) -> None:
         self._nats_url = nats_url
         self._stream_name = stream_name
+        self._pending_size = pending_size
+        self._flusher_queue_size = flusher_queue_size
         self._nc: NATSConnection | None = None
         self._js: JetStreamContext | None = None
+        # In-flight publish_async() calls whose ACKs have not been awaited yet
+        self._max_pending = max_pending
+        self._pending: deque[asyncio.Task[PubAck]] = deque()
+        # Serializes envelopes and parses delivered messages straight from bytes
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder(Envelope)
 
     async def connect(self) -> None:
         """Connect to NATS and ensure the JetStream stream exists."""
-        self._nc = await nats.connect(self._nats_url)
+        self._nc = await nats.connect(
+            self._nats_url,
+            pending_size=self._pending_size,
+            flusher_queue_size=self._flusher_queue_size,
+        )
         self._js = self._nc.jetstream()
 
         # Create or update the stream — idempotent
@@ -64,42 +127,94 @@ class NATSClient:
     async def publish(self, subject: str, data: dict[str, Any]) -> None:
         """Publish an event to a NATS JetStream subject.
 
-        Wraps the payload in a standard envelope with metadata:
-            {
-                "event_id": "uuid",
-                "subject": "art.created",
-                "timestamp": "ISO-8601",
-                "data": { ... your payload ... }
-            }
+        Wraps the payload in a standard Envelope with metadata (event ID,
+        subject, UTC timestamp). Dict keys anywhere in the payload must be
+        str-like or number-like (str, int, float, Enum, UUID, date/time,
+        Decimal); non-str keys are encoded as JSON strings, e.g. 1 as "1".
+        Unlike stdlib json, None, bool and tuple keys raise TypeError.
         """
         if not self._js:
             msg = "NATS not connected. Call connect() first."
             raise RuntimeError(msg)
 
-        envelope = {
-            "event_id": str(uuid4()),
-            "subject": subject,
-            "timestamp": datetime.now(tz=UTC).isoformat(),
-            "data": data,
-        }
-
-        payload = json.dumps(envelope).encode()
-        ack = await self._js.publish(subject, payload)
+        ack = await self._js.publish(subject, self._encode_envelope(subject, data))
         logger.info("event_published", subject=subject, stream=ack.stream, seq=ack.seq)
 
+    async def publish_async(self, subject: str, data: dict[str, Any]) -> None:
+        """Publish an event without waiting for its JetStream ACK.
+
+        Uses the same envelope as publish(). ACKs are awaited in batches:
+        once max_pending publishes are in flight, this call waits for all
+        of them. Call flush() to wait for the remainder.
+        """
+        if not self._js:
+            msg = "NATS not connected. Call connect() first."
+            raise RuntimeError(msg)
+
+        self._pending.append(asyncio.create_task(self._js.publish(subject, self._encode_envelope(subject, data))))
+        if len(self._pending) >= self._max_pending:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Wait for the ACKs of all in-flight publish_async() calls.
+
+        Every failed publish is logged; the first failure is then re-raised.
+        """
+        if not self._pending:
+            return
+
+        pending = list(self._pending)
+        self._pending.clear()
+        results = await asyncio.gather(*pending, return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for error in errors:
+            logger.error("event_publish_failed", error=str(error))
+        logger.info("events_flushed", published=len(results) - len(errors), failed=len(errors))
+        if errors:
+            raise errors[0]
+
+    def _encode_envelope(self, subject: str, data: dict[str, Any]) -> bytes:
+        """Wrap the payload in the standard event envelope and serialize it."""
+        envelope = Envelope(
+            # 128 random bits, like a UUID4, without building a UUID object
+            event_id=base64.urlsafe_b64encode(os.urandom(16)).rstrip(b"=").decode(),
+            subject=subject,
+            timestamp=datetime.now(tz=UTC),
+            data=data,
+        )
+        # msgspec formats the datetime (ISO-8601 with "Z") in C and emits UTF-8 bytes directly
+        return self._encoder.encode(envelope)
+
     async def subscribe(
         self,
         subject: str,
         handler: EventHandler,
         durable_name: str | None = None,
+        batch_size: int | None = None,
+        max_concurrency: int = 32,
     ) -> None:
         """Subscribe to a NATS JetStream subject with a pull subscription.
 
+        Messages are fetched in batches, so a busy consumer pays one round
+        trip per batch instead of one per message. Handlers within a batch
+        run concurrently, so only use this for events that can be processed
+        in any order. A batch never exceeds max_concurrency messages: every
+        fetched message starts its handler immediately, instead of queueing
+        while its ack_wait runs out and JetStream redelivers it. Returns once
+        the connection is draining or closed; other fetch errors (e.g., no
+        responders during a JetStream leader change) are logged and retried
+        with exponential backoff.
+
         Args:
             subject: NATS subject pattern (e.g., "art.created" or "art.>").
             handler: Async function that receives the event data dict.
             durable_name: Durable consumer name for reliable delivery.
                           Defaults to subject with dots replaced by dashes.
+            batch_size: Maximum number of messages pulled per fetch.
+                        Defaults to (and is capped at) max_concurrency.
+            max_concurrency: Maximum number of handlers running at once.
+                             Set to 1 to process events strictly in order.
         """
         if not self._js:
             msg = "NATS not connected. Call connect() first."
@@ -108,21 +223,58 @@ class NATSClient:
         if durable_name is None:
             durable_name = subject.replace(".", "-").replace(">", "all")
 
-        subscription = await self._js.subscribe(subject, durable=durable_name)
-        logger.info("event_subscribed", subject=subject, durable=durable_name)
+        batch_size = max_concurrency if batch_size is None else min(batch_size, max_concurrency)
 
-        async for msg in subscription.messages:
+        subscription = await self._js.pull_subscribe(subject, durable=durable_name)
+        logger.info("event_subscribed", subject=subject, durable=durable_name, batch_size=batch_size)
+
+        retry_delay = _FETCH_RETRY_DELAY_MIN
+        while self._nc and not (self._nc.is_closed or self._nc.is_draining):
             try:
-                envelope = json.loads(msg.data.decode())
-                await handler(envelope.get("data", {}))
-                await msg.ack()
-            except Exception:
-                logger.exception("event_handler_error", subject=subject, data=msg.data.decode())
-                # NATS will redeliver on nack (or timeout)
-                await msg.nak()
+                msgs = await subscription.fetch(batch=batch_size, timeout=5)
+            except TimeoutError:
+                # No messages arrived within the timeout — poll again. The builtin
+                # also covers the plain asyncio.TimeoutError fetch() can raise
+                # instead of nats.errors.TimeoutError
+                continue
+            except (nats.errors.ConnectionClosedError, nats.errors.ConnectionDrainingError):
+                # close() started draining while we were waiting for messages
+                break
+            except nats.errors.Error as e:
+                logger.warning("event_fetch_failed", subject=subject, error=str(e), retry_in=retry_delay)
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, _FETCH_RETRY_DELAY_MAX)
+                continue
+
+            retry_delay = _FETCH_RETRY_DELAY_MIN
+            await asyncio.gather(*(self._handle_message(subject, handler, msg) for msg in msgs))
+
+    async def _handle_message(self, subject: str, handler: EventHandler, msg: Msg) -> None:
+        """Run the handler on one delivered message, then ack (or nak on failure).
+
+        Messages that are not a valid Envelope are terminated rather than
+        nak'd, since redelivering them can never succeed.
+        """
+        try:
+            envelope = self._decoder.decode(msg.data)
+        except (msgspec.DecodeError, msgspec.ValidationError):
+            logger.exception("event_malformed", subject=subject, data=msg.data.decode(errors="replace"))
+            await msg.term()
+            return
+
+        try:
+            await handler(envelope.data)
+            await msg.ack()
+        except Exception:
+            logger.exception("event_handler_error", subject=subject, data=msg.data.decode(errors="replace"))
+            # NATS will redeliver on nack (or timeout)
+            await msg.nak()
 
     async def close(self) -> None:
-        """Gracefully close the NATS connection."""
-        if self._nc:
-            await self._nc.drain()
-            logger.info("nats_disconnected")
+        """Wait for pending publishes, then gracefully close the NATS connection."""
+        try:
+            await self.flush()
+        finally:
+            if self._nc:
+                await self._nc.drain()
+                logger.info("nats_disconnected")
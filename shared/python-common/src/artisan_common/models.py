@@ -44,6 +44,7 @@ class ArtisanModel(BaseModel):
         from_attributes=True,  # Allows creating from SQLAlchemy ORM objects
         populate_by_name=True,
         str_strip_whitespace=True,
+        use_enum_values=True,  # Store enum fields as their plain string values
     )
 
 
@@ -59,10 +60,14 @@ class HealthResponse(BaseModel):
     environment: str
 
 
-class PaginatedResponse(BaseModel):
-    """Standard paginated response wrapper."""
+class PaginatedResponse[T: BaseModel](BaseModel):
+    """Standard paginated response wrapper.
 
-    items: list[BaseModel] = Field(default_factory=list)
+    Parametrize with the item model, e.g. PaginatedResponse[ArtworkEvent],
+    so items are validated against one concrete schema.
+    """
+
+    items: list[T] = Field(default_factory=list)
     total: int = 0
     page: int = 1
     page_size: int = 20
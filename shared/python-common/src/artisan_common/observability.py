@@ -13,14 +13,22 @@ Usage:
     setup_observability(service_name="gallery-service", service_version="0.1.0")
 """
 
+import json
 import logging
+import os
 from typing import Any
 
+import orjson
 import structlog
 from opentelemetry import trace
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+# Span batching used when neither an argument nor its OTEL_BSP_* variable is set.
+# Compared with the SDK defaults (2048 spans, 512 spans, 5000 ms), the queue is
+# doubled and exports run five times as often, so bursts from high-event-rate
+# services are not dropped.
+_SPAN_QUEUE_SIZE = 4096  # spans (OTEL_BSP_MAX_QUEUE_SIZE)
+_SPAN_BATCH_SIZE = 512  # spans (OTEL_BSP_MAX_EXPORT_BATCH_SIZE)
+_SPAN_DELAY_MS = 1000  # milliseconds (OTEL_BSP_SCHEDULE_DELAY)
 
 
 def setup_observability(
@@ -29,6 +37,9 @@ def setup_observability(
     otel_endpoint: str | None = None,
     log_level: str = "INFO",
     otel_enabled: bool = True,
+    otel_queue_size: int | None = None,
+    otel_batch_size: int | None = None,
+    otel_delay_ms: int | None = None,
 ) -> None:
     """Initialize OpenTelemetry tracing and structured logging.
 
@@ -38,44 +49,86 @@ def setup_observability(
         otel_endpoint: OTLP collector endpoint. None uses console exporter.
         log_level: Python log level string.
         otel_enabled: Set False to disable tracing (e.g., in tests).
+        otel_queue_size: Spans buffered before new ones are dropped.
+        otel_batch_size: Maximum spans sent per export call.
+        otel_delay_ms: Maximum time between exports, in milliseconds.
+
+    The three span batching knobs default to None, which means
+    OTEL_BSP_MAX_QUEUE_SIZE, OTEL_BSP_MAX_EXPORT_BATCH_SIZE and
+    OTEL_BSP_SCHEDULE_DELAY if set, otherwise 4096 spans, 512 spans and
+    1000 ms (tuned for high event rates, see _SPAN_QUEUE_SIZE).
     """
-    _setup_logging(service_name, log_level)
+    _setup_logging(service_name, log_level, otel_enabled)
 
     if otel_enabled:
-        _setup_tracing(service_name, service_version, otel_endpoint)
-
-
-def _setup_logging(service_name: str, log_level: str) -> None:
-    """Configure structlog for JSON-formatted output with trace correlation."""
+        _setup_tracing(
+            service_name,
+            service_version,
+            otel_endpoint,
+            queue_size=otel_queue_size,
+            batch_size=otel_batch_size,
+            delay_ms=otel_delay_ms,
+        )
+
+
+def _setup_logging(service_name: str, log_level: str, otel_enabled: bool = True) -> None:
+    """Configure structlog for JSON-formatted output with trace correlation.
+
+    The filtering bound logger drops below-level calls before any processor
+    runs, so disabled log levels cost a single no-op method call. Trace
+    correlation is only added when tracing is enabled.
+    """
+    processors: list[structlog.typing.Processor] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        # Keeps a timestamp the caller already bound instead of generating another
+        structlog.processors.MaybeTimeStamper(fmt="iso", utc=True),
+    ]
+    if otel_enabled:
+        processors.append(_add_trace_context)
+    processors += [
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        # Returns bytes, which BytesLogger writes without re-encoding
+        structlog.processors.JSONRenderer(serializer=_dumps_log_entry),
+    ]
 
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            _add_trace_context,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
-        ],
+        processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelNamesMapping()[log_level.upper()]),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.BytesLoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+def _dumps_log_entry(obj: Any, **kwargs: Any) -> bytes:
+    """Serialize a log entry with orjson, falling back to stdlib json.
+
+    OPT_NON_STR_KEYS renders non-str dict keys as strings, like stdlib json.
+    Anything orjson still rejects (e.g., ints wider than 64 bits) goes
+    through stdlib json so a log call never raises into the caller.
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs)
+    except TypeError:
+        return json.dumps(obj, separators=(",", ":"), **kwargs).encode()
+
+
 def _add_trace_context(
     logger: Any,
     method_name: str,
-    event_dict: dict[str, Any],
-) -> dict[str, Any]:
+    event_dict: structlog.typing.EventDict,
+) -> structlog.typing.EventDict:
     """Inject OpenTelemetry trace and span IDs into every log entry."""
     span = trace.get_current_span()
-    if span.is_recording():
-        ctx = span.get_span_context()
-        event_dict["trace_id"] = f"{ctx.trace_id:032x}"
-        event_dict["span_id"] = f"{ctx.span_id:016x}"
+    # Identity check against the "no active span" sentinel — cheaper than is_recording()
+    if span is trace.INVALID_SPAN:
+        return event_dict
+
+    ctx = span.get_span_context()
+    event_dict["trace_id"] = f"{ctx.trace_id:032x}"
+    event_dict["span_id"] = f"{ctx.span_id:016x}"
     return event_dict
 
 
@@ -83,8 +136,16 @@ def _setup_tracing(
     service_name: str,
     service_version: str,
     otel_endpoint: str | None,
+    queue_size: int | None,
+    batch_size: int | None,
+    delay_ms: int | None,
 ) -> None:
     """Configure OpenTelemetry with OTLP exporter or console fallback."""
+    # Lazy import: the SDK is only loaded by services that enable tracing
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
     resource = Resource.create(
         {
             "service.name": service_name,
@@ -104,5 +165,23 @@ def _setup_tracing(
         # Console exporter — used in local development
         exporter = ConsoleSpanExporter()
 
-    provider.add_span_processor(BatchSpanProcessor(exporter))
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            exporter,
+            max_queue_size=_span_batch_setting(queue_size, "OTEL_BSP_MAX_QUEUE_SIZE", _SPAN_QUEUE_SIZE),
+            max_export_batch_size=_span_batch_setting(batch_size, "OTEL_BSP_MAX_EXPORT_BATCH_SIZE", _SPAN_BATCH_SIZE),
+            schedule_delay_millis=_span_batch_setting(delay_ms, "OTEL_BSP_SCHEDULE_DELAY", _SPAN_DELAY_MS),
+        )
+    )
     trace.set_tracer_provider(provider)
+
+
+def _span_batch_setting(value: int | None, env_var: str, default: int) -> int | None:
+    """Resolve one BatchSpanProcessor setting: argument, then env var, then default.
+
+    Returns None when only the env var is set, so the SDK parses and
+    validates it exactly as it would without this wrapper.
+    """
+    if value is not None:
+        return value
+    return None if os.environ.get(env_var) else default
@@ -0,0 +1,254 @@
+"""Tests for JWT validation: JWKS caching and the verified-token cache."""
+
+import asyncio
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+import pytest
+from cachetools import TLRUCache
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwk, jwt
+
+from artisan_common import auth
+from artisan_common.config import get_settings
+
+AUDIENCE = "artisan-api"
+
+
+class SigningKey:
+    """An RSA key pair that signs test tokens and publishes its JWK."""
+
+    def __init__(self, kid: str) -> None:
+        self.kid = kid
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        public_pem = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        self.jwk = {**jwk.construct(public_pem.decode(), "RS256").to_dict(), "kid": kid, "use": "sig"}
+
+    def token(self, sub: str = "user-1", exp_in: float = 60, kid: Any = None) -> str:
+        claims = {
+            "sub": sub,
+            "aud": AUDIENCE,
+            "exp": int(time.time() + exp_in),
+            "email": f"{sub}@example.com",
+            "realm_access": {"roles": ["artist"]},
+        }
+        token: str = jwt.encode(claims, self.pem, algorithm="RS256", headers={"kid": self.kid if kid is None else kid})
+        return token
+
+
+class FakeKeycloak:
+    """Serves a JWKS over an httpx mock transport and counts fetches."""
+
+    def __init__(self, keys: list[dict[str, Any]]) -> None:
+        self.keys = keys
+        self.fetches = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.fetches += 1
+        await asyncio.sleep(0.01)  # Let concurrent requests pile up on the lock
+        return httpx.Response(200, json={"keys": self.keys})
+
+
+class FakeClock:
+    """Monotonic clock for the verified-token cache that tests can advance."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def signing_key() -> SigningKey:
+    return SigningKey("key-1")
+
+
+@pytest.fixture
+def keycloak(signing_key: SigningKey, monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeKeycloak]:
+    fake = FakeKeycloak([signing_key.jwk])
+    monkeypatch.setattr(auth, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(fake.handler)))
+    monkeypatch.setattr(auth, "_jwks_cache", {})
+    monkeypatch.setattr(auth, "_jwks_lock", asyncio.Lock())
+    get_settings.cache_clear()
+    yield fake
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(auth, "_token_cache", TLRUCache(maxsize=100, ttu=auth._token_ttu, timer=fake))
+    return fake
+
+
+@pytest.fixture
+def decode_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every token that goes through signature verification."""
+    calls: list[str] = []
+    real_decode = jwt.decode
+
+    def counting_decode(token: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        calls.append(token)
+        payload: dict[str, Any] = real_decode(token, *args, **kwargs)
+        return payload
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+    return calls
+
+
+def _credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+# ── Verified-token cache ──────────────────────────────────────
+
+
+async def test_valid_token_returns_user(signing_key: SigningKey, keycloak: FakeKeycloak, clock: FakeClock) -> None:
+    user = await auth.get_current_user(_credentials(signing_key.token()))
+
+    assert user == auth.User(sub="user-1", email="user-1@example.com", roles=["artist"])
+
+
+async def test_cache_hit_skips_verification(
+    signing_key: SigningKey, keycloak: FakeKeycloak, clock: FakeClock, decode_calls: list[str]
+) -> None:
+    token = signing_key.token()
+
+    first = await auth.get_current_user(_credentials(token))
+    second = await auth.get_current_user(_credentials(token))
+
+    assert first == second
+    assert len(decode_calls) == 1
+
+
+async def test_cache_hits_do_not_share_roles(signing_key: SigningKey, keycloak: FakeKeycloak, clock: FakeClock) -> None:
+    token = signing_key.token()
+
+    first = await auth.get_current_user(_credentials(token))
+    first.roles.append("admin")
+    second = await auth.get_current_user(_credentials(token))
+    second.roles.clear()
+    third = await auth.get_current_user(_credentials(token))
+
+    assert third.roles == ["artist"]
+
+
+async def test_cache_entry_expires_at_token_exp(
+    signing_key: SigningKey, keycloak: FakeKeycloak, clock: FakeClock, decode_calls: list[str]
+) -> None:
+    token = signing_key.token(exp_in=10)
+    await auth.get_current_user(_credentials(token))
+
+    clock.now += 5
+    await auth.get_current_user(_credentials(token))
+    assert len(decode_calls) == 1
+
+    # Past exp the entry is gone, so the token goes through verification again
+    clock.now += 10
+    await auth.get_current_user(_credentials(token))
+    assert len(decode_calls) == 2
+
+
+async def test_cache_entry_ttl_is_capped(
+    signing_key: SigningKey, keycloak: FakeKeycloak, clock: FakeClock, decode_calls: list[str]
+) -> None:
+    token = signing_key.token(exp_in=3600)
+    await auth.get_current_user(_credentials(token))
+
+    clock.now += auth._TOKEN_CACHE_TTL + 1
+    await auth.get_current_user(_credentials(token))
+
+    assert len(decode_calls) == 2
+
+
+async def test_expired_token_is_rejected_and_not_cached(
+    signing_key: SigningKey, keycloak: FakeKeycloak, clock: FakeClock
+) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await auth.get_current_user(_credentials(signing_key.token(exp_in=-10)))
+
+    assert exc_info.value.status_code == 401
+    assert len(auth._token_cache) == 0
+
+
+# ── JWKS fetching ─────────────────────────────────────────────
+
+
+async def test_concurrent_cold_requests_fetch_jwks_once(
+    signing_key: SigningKey, keycloak: FakeKeycloak, clock: FakeClock
+) -> None:
+    tokens = [signing_key.token(sub=f"user-{i}") for i in range(20)]
+
+    users = await asyncio.gather(*(auth.get_current_user(_credentials(token)) for token in tokens))
+
+    assert [user.sub for user in users] == [f"user-{i}" for i in range(20)]
+    assert keycloak.fetches == 1
+
+
+async def test_non_rsa_signing_keys_are_skipped(
+    signing_key: SigningKey, keycloak: FakeKeycloak, clock: FakeClock
+) -> None:
+    ec_public_pem = (
+        ec.generate_private_key(ec.SECP256R1())
+        .public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+    )
+    ec_key = {**jwk.construct(ec_public_pem.decode(), "ES256").to_dict(), "kid": "ec-1", "use": "sig"}
+    keycloak.keys = [signing_key.jwk, ec_key]
+
+    user = await auth.get_current_user(_credentials(signing_key.token()))
+
+    assert user.sub == "user-1"
+    assert keycloak.fetches == 1
+
+
+async def test_unknown_kid_refetches_jwks_after_rotation(
+    signing_key: SigningKey, keycloak: FakeKeycloak, clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await auth.get_current_user(_credentials(signing_key.token()))
+    rotated = SigningKey("key-2")
+    keycloak.keys = [rotated.jwk]
+    monkeypatch.setattr(auth, "_JWKS_REFRESH_INTERVAL", 0)
+
+    user = await auth.get_current_user(_credentials(rotated.token(sub="user-2")))
+
+    assert user.sub == "user-2"
+    assert keycloak.fetches == 2
+
+
+async def test_unknown_kid_refetches_are_rate_limited(
+    signing_key: SigningKey, keycloak: FakeKeycloak, clock: FakeClock
+) -> None:
+    await auth.get_current_user(_credentials(signing_key.token()))
+    stranger = SigningKey("unknown")
+
+    for _ in range(5):
+        with pytest.raises(HTTPException):
+            await auth.get_current_user(_credentials(stranger.token()))
+
+    assert keycloak.fetches == 1
+
+
+@pytest.mark.parametrize("kid", [["key-1"], {}, 1])
+async def test_non_str_kid_is_rejected(
+    kid: Any, signing_key: SigningKey, keycloak: FakeKeycloak, clock: FakeClock
+) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await auth.get_current_user(_credentials(signing_key.token(kid=kid)))
+
+    assert exc_info.value.status_code == 401
+    assert keycloak.fetches == 0
@@ -0,0 +1,94 @@
+"""Tests for loading settings from the environment and .env files."""
+
+from pathlib import Path
+
+import msgspec
+import pytest
+
+from artisan_common.config import BaseServiceSettings
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep variables from the test runner's environment out of the settings."""
+    for name in BaseServiceSettings.__struct_fields__:
+        monkeypatch.delenv(name.upper(), raising=False)
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def env_file(tmp_path: Path) -> Path:
+    path = tmp_path / ".env"
+    path.write_text("SERVICE_NAME=from-dotenv\nPORT=9000\nLOG_LEVEL=DEBUG\n")
+    return path
+
+
+def test_defaults_without_env(tmp_path: Path) -> None:
+    settings = BaseServiceSettings.from_env(env_file=str(tmp_path / "missing.env"))
+
+    assert settings == BaseServiceSettings()
+
+
+def test_env_overrides_dotenv_overrides_defaults(env_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SERVICE_NAME", "from-env")
+
+    settings = BaseServiceSettings.from_env(env_file=str(env_file))
+
+    assert settings.service_name == "from-env"  # Environment beats .env
+    assert settings.port == 9000  # .env beats the default
+    assert settings.log_level == "DEBUG"
+    assert settings.environment == "local"  # Default
+
+
+def test_names_are_case_insensitive(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("Keycloak_Realm", "other")
+
+    assert BaseServiceSettings.from_env(env_file=None).keycloak_realm == "other"
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("yes", True), ("ON", True), ("t", True), ("1", True), ("no", False), ("off", False), ("False", False)],
+)
+def test_bool_spellings(raw: str, expected: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DEBUG", raw)
+
+    assert BaseServiceSettings.from_env(env_file=None).debug is expected
+
+
+def test_whitespace_is_stripped_for_non_str_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PORT", " 8001 ")
+    monkeypatch.setenv("OTEL_ENABLED", " off")
+    monkeypatch.setenv("SERVICE_NAME", " padded ")
+
+    settings = BaseServiceSettings.from_env(env_file=None)
+
+    assert settings.port == 8001
+    assert settings.otel_enabled is False
+    assert settings.service_name == " padded "
+
+
+def test_invalid_value_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DEBUG", "maybe")
+
+    with pytest.raises(msgspec.ValidationError):
+        BaseServiceSettings.from_env(env_file=None)
+
+
+def test_subclass_fields_are_loaded(monkeypatch: pytest.MonkeyPatch) -> None:
+    class GallerySettings(BaseServiceSettings, frozen=True):
+        s3_bucket: str = "artisan-gallery"
+        max_upload_size_mb: int = 10
+
+    monkeypatch.setenv("MAX_UPLOAD_SIZE_MB", "25")
+
+    settings = GallerySettings.from_env(env_file=None)
+
+    assert settings.max_upload_size_mb == 25
+    assert settings.s3_bucket == "artisan-gallery"
+
+
+def test_pydantic_settings_match_struct_fields() -> None:
+    from artisan_common.pydantic_config import PydanticServiceSettings
+
+    assert set(PydanticServiceSettings.model_fields) == set(BaseServiceSettings.__struct_fields__)
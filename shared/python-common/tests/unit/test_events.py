@@ -0,0 +1,246 @@
+"""Tests for NATSClient's subscribe loop and batched publishing, using a fake JetStream."""
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+
+import nats.errors
+import nats.js.errors
+import pytest
+
+from artisan_common import events
+from artisan_common.events import NATSClient
+
+
+class FakeMsg:
+    """Records how a delivered message was settled."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.outcome: str | None = None
+
+    async def ack(self) -> None:
+        self.outcome = "ack"
+
+    async def nak(self) -> None:
+        self.outcome = "nak"
+
+    async def term(self) -> None:
+        self.outcome = "term"
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.is_closed = False
+        self.is_draining = False
+
+
+class FakeSubscription:
+    """Hands out queued batches (or raises queued errors), then behaves like a draining connection."""
+
+    def __init__(self, conn: FakeConnection, batches: Iterator[list[FakeMsg] | Exception]) -> None:
+        self._conn = conn
+        self._batches = batches
+        self.fetch_sizes: list[int] = []
+
+    async def fetch(self, batch: int, timeout: float) -> list[FakeMsg]:
+        self.fetch_sizes.append(batch)
+        try:
+            queued = next(self._batches)
+        except StopIteration:
+            self._conn.is_draining = True
+            raise nats.errors.ConnectionDrainingError from None
+        if isinstance(queued, Exception):
+            raise queued
+        return queued
+
+
+class FakeAck:
+    stream = "ARTISAN"
+    seq = 1
+
+
+class FakeJetStream:
+    def __init__(self, conn: FakeConnection) -> None:
+        self.conn = conn
+        self.batches: list[list[FakeMsg] | Exception] = []
+        self.published: list[tuple[str, bytes]] = []
+        self.subscription: FakeSubscription | None = None
+
+    async def pull_subscribe(self, subject: str, durable: str) -> FakeSubscription:
+        self.subscription = FakeSubscription(self.conn, iter(self.batches))
+        return self.subscription
+
+    async def publish(self, subject: str, payload: bytes) -> FakeAck:
+        self.published.append((subject, payload))
+        return FakeAck()
+
+
+@pytest.fixture
+def js() -> FakeJetStream:
+    return FakeJetStream(FakeConnection())
+
+
+@pytest.fixture
+def client(js: FakeJetStream) -> NATSClient:
+    nats_client = NATSClient(max_pending=3)
+    nats_client._nc = js.conn  # type: ignore[assignment]
+    nats_client._js = js  # type: ignore[assignment]
+    return nats_client
+
+
+def _event(client: NATSClient, data: dict[str, Any]) -> FakeMsg:
+    return FakeMsg(client._encode_envelope("art.created", data))
+
+
+# ── Subscribing ───────────────────────────────────────────────
+
+
+async def test_acks_handled_messages_and_naks_failures(client: NATSClient, js: FakeJetStream) -> None:
+    ok = _event(client, {"artwork_id": "ok"})
+    failing = _event(client, {"artwork_id": "boom"})
+    js.batches = [[ok, failing]]
+    received: list[dict[str, Any]] = []
+
+    async def handler(event: dict[str, Any]) -> None:
+        if event["artwork_id"] == "boom":
+            msg = "handler failed"
+            raise ValueError(msg)
+        received.append(event)
+
+    await client.subscribe("art.created", handler)
+
+    assert received == [{"artwork_id": "ok"}]
+    assert ok.outcome == "ack"
+    assert failing.outcome == "nak"  # Redelivered later
+
+
+async def test_terminates_malformed_messages(client: NATSClient, js: FakeJetStream) -> None:
+    malformed = FakeMsg(b'{"event_id": 1}')
+    undecodable = FakeMsg(b"\xff")
+    js.batches = [[malformed, undecodable]]
+    received: list[dict[str, Any]] = []
+
+    async def handler(event: dict[str, Any]) -> None:
+        received.append(event)
+
+    await client.subscribe("art.created", handler)
+
+    assert received == []
+    # Redelivering these can never succeed
+    assert malformed.outcome == "term"
+    assert undecodable.outcome == "term"
+
+
+async def test_returns_when_connection_drains(client: NATSClient, js: FakeJetStream) -> None:
+    js.batches = [[_event(client, {"n": 1})]]
+
+    async def handler(event: dict[str, Any]) -> None:
+        pass
+
+    await asyncio.wait_for(client.subscribe("art.created", handler), timeout=1)
+
+    assert js.subscription is not None
+    assert len(js.subscription.fetch_sizes) == 2
+
+
+async def test_does_not_fetch_once_draining(client: NATSClient, js: FakeJetStream) -> None:
+    js.conn.is_draining = True
+
+    async def handler(event: dict[str, Any]) -> None:
+        pass
+
+    await asyncio.wait_for(client.subscribe("art.created", handler), timeout=1)
+
+    assert js.subscription is not None
+    assert js.subscription.fetch_sizes == []
+
+
+async def test_keeps_polling_after_fetch_timeouts(client: NATSClient, js: FakeJetStream) -> None:
+    event = _event(client, {"n": 1})
+    # Depending on where the fetch deadline runs out, nats-py raises its own
+    # TimeoutError or a plain asyncio.TimeoutError (the builtin)
+    js.batches = [nats.errors.TimeoutError(), TimeoutError(), [event]]
+
+    async def handler(event: dict[str, Any]) -> None:
+        pass
+
+    await asyncio.wait_for(client.subscribe("art.created", handler), timeout=1)
+
+    assert event.outcome == "ack"
+
+
+async def test_retries_after_transient_fetch_errors(
+    client: NATSClient, js: FakeJetStream, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(events, "_FETCH_RETRY_DELAY_MIN", 0)
+    event = _event(client, {"n": 1})
+    js.batches = [nats.errors.NoRespondersError(), nats.js.errors.ServiceUnavailableError(), [event]]
+
+    async def handler(event: dict[str, Any]) -> None:
+        pass
+
+    await asyncio.wait_for(client.subscribe("art.created", handler), timeout=1)
+
+    assert event.outcome == "ack"
+
+
+async def test_batch_size_is_capped_at_max_concurrency(client: NATSClient, js: FakeJetStream) -> None:
+    async def handler(event: dict[str, Any]) -> None:
+        pass
+
+    await client.subscribe("art.created", handler, batch_size=256, max_concurrency=8)
+
+    assert js.subscription is not None
+    assert js.subscription.fetch_sizes == [8]
+
+
+async def test_handlers_in_a_batch_run_concurrently(client: NATSClient, js: FakeJetStream) -> None:
+    js.batches = [[_event(client, {"n": i}) for i in range(3)]]
+    started = 0
+    all_started = asyncio.Event()
+
+    async def handler(event: dict[str, Any]) -> None:
+        nonlocal started
+        started += 1
+        if started == 3:
+            all_started.set()
+        # Deadlocks (and times out) if handlers ran one after another
+        await asyncio.wait_for(all_started.wait(), timeout=1)
+
+    await client.subscribe("art.created", handler)
+
+    assert started == 3
+
+
+# ── Publishing ────────────────────────────────────────────────
+
+
+async def test_envelope_round_trips(client: NATSClient) -> None:
+    payload: dict[Any, Any] = {1: "x", "big": 2**70}
+
+    envelope = client._decoder.decode(client._encode_envelope("art.created", payload))
+
+    assert envelope.subject == "art.created"
+    assert len(envelope.event_id) == 22
+    assert envelope.timestamp.tzinfo is not None
+    assert envelope.data == {"1": "x", "big": 2**70}
+
+
+@pytest.mark.parametrize("key", [None, True, (1, 2)])
+async def test_publish_rejects_keys_that_are_not_str_or_number_like(client: NATSClient, key: Any) -> None:
+    with pytest.raises(TypeError):
+        await client.publish("art.created", {"nested": {key: 1}})
+
+
+async def test_publish_async_waits_in_batches(client: NATSClient, js: FakeJetStream) -> None:
+    for i in range(4):
+        await client.publish_async("art.created", {"n": i})
+
+    assert len(js.published) == 3  # The third call hit max_pending and waited
+    assert len(client._pending) == 1
+
+    await client.flush()
+
+    assert len(js.published) == 4
+    assert not client._pending
@@ -0,0 +1,23 @@
+"""Tests for span batching configuration."""
+
+import pytest
+
+from artisan_common.observability import _SPAN_QUEUE_SIZE, _span_batch_setting
+
+
+def test_argument_wins_over_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OTEL_BSP_MAX_QUEUE_SIZE", "20000")
+
+    assert _span_batch_setting(8192, "OTEL_BSP_MAX_QUEUE_SIZE", _SPAN_QUEUE_SIZE) == 8192
+
+
+def test_env_is_left_to_the_sdk(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OTEL_BSP_MAX_QUEUE_SIZE", "20000")
+
+    assert _span_batch_setting(None, "OTEL_BSP_MAX_QUEUE_SIZE", _SPAN_QUEUE_SIZE) is None
+
+
+def test_tuned_default_without_argument_or_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OTEL_BSP_MAX_QUEUE_SIZE", raising=False)
+
+    assert _span_batch_setting(None, "OTEL_BSP_MAX_QUEUE_SIZE", _SPAN_QUEUE_SIZE) == 4096